@@ -1,11 +1,4 @@
 # encoding=utf8
-# This is temporary fix to import module from parent folder
-# It will be removed when package is published on PyPI
-import sys
-
-sys.path.append('../')
-# End of fix
-
 from niapy.algorithms.modified import MultiStrategyDifferentialEvolutionMTSv1
 from niapy.algorithms.basic.de import cross_rand1, cross_best1
 from niapy.task import Task
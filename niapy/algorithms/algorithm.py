@@ -35,7 +35,7 @@ def default_numpy_init(task, population_size, rng, **_kwargs):
 
     """
     pop = rng.uniform(task.lower, task.upper, (population_size, task.dimension))
-    fpop = np.apply_along_axis(task.eval, 1, pop)
+    fpop = task.eval_batch(pop)
     return pop, fpop
 
 
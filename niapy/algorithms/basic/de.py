@@ -418,7 +418,6 @@ class DifferentialEvolution(Algorithm):
         population, best_x, best_fitness = self.selection(population, new_population, best_x, best_fitness, task=task)
         population, best_x, best_fitness = self.post_selection(population, task, best_x, best_fitness)
         population_fitness = np.asarray([x.f for x in population])
-        best_x, best_fitness = self.get_best(population, population_fitness, best_x, best_fitness)
         return population, population_fitness, best_x, best_fitness, {}
 
 
@@ -815,6 +814,7 @@ class AgingNpDifferentialEvolution(DifferentialEvolution):
         new_population = np.append(new_population, self.increment_population(task))
         best_x, best_fitness = self.get_best(new_population, np.asarray([e.f for e in new_population]), best_x, best_fitness)
         population = self.aging(task, new_population)
+        best_x, best_fitness = self.get_best(population, np.asarray([e.f for e in population]), best_x, best_fitness)
         return population, best_x, best_fitness
 
     def post_selection(self, pop, task, xb, fxb, **kwargs):
@@ -1,5 +1,4 @@
 # encoding=utf8
-import copy
 import logging
 import numpy
 import numpy as np
@@ -68,6 +67,25 @@ class Lion(Individual):
         self.previous_iter_best_f = self.f
         self.has_improved = has_improved
 
+    def copy(self):
+        r"""Return a copy of the lion.
+
+        Copies the two position arrays and assigns the scalar attributes
+        directly, which is considerably cheaper than the reflective walk done
+        by :func:`copy.deepcopy`.
+
+        Returns:
+            Lion: Copy of self.
+
+        """
+        lion = Lion(x=self.x.copy(), e=False, gender=self.gender, has_pride=self.has_pride, pride=self.pride,
+                    hunting_group=self.hunting_group, has_improved=self.has_improved)
+        lion.f = self.f
+        lion.current_x = self.current_x.copy()
+        lion.current_f = self.current_f
+        lion.previous_iter_best_f = self.previous_iter_best_f
+        return lion
+
 
 class LionOptimizationAlgorithm(Algorithm):
     r"""Implementation of lion optimization algorithm.
@@ -371,7 +389,7 @@ class LionOptimizationAlgorithm(Algorithm):
             num_of_improvements = 0
             pride_territory = []
             for lion in population[index_counter_pride:index_counter_pride + curr_pride_size]:
-                lion_copy = copy.deepcopy(lion)
+                lion_copy = lion.copy()
                 pride_territory = np.append(pride_territory, objects_to_array([lion_copy]))
                 if lion.has_improved:
                     num_of_improvements += 1
@@ -444,7 +462,7 @@ class LionOptimizationAlgorithm(Algorithm):
                     # Select all lions in pride.
                     pride_lions = []
                     for p_l in population[index_counter_pride:index_counter_pride + curr_pride_size]:
-                        lion_copy = copy.deepcopy(p_l)
+                        lion_copy = p_l.copy()
                         pride_lions = np.append(pride_lions, objects_to_array([lion_copy]))
                     # Select random lions, their amount is based on roaming factor.
                     num_of_selected_lions = round(len(pride_lions) * self.roaming_factor)
@@ -505,7 +523,7 @@ class LionOptimizationAlgorithm(Algorithm):
         for pride_i in range(num_of_prides):
             curr_pride_size = pride_size[pride_i]
             for lion in population[index_counter_pride:index_counter_pride + curr_pride_size]:
-                lion_copy = copy.deepcopy(lion)
+                lion_copy = lion.copy()
                 pride_lions = np.append(pride_lions, objects_to_array([lion_copy]))
             index_counter_pride += curr_pride_size
 
@@ -513,7 +531,7 @@ class LionOptimizationAlgorithm(Algorithm):
         nomad_lions = []
         nomad_size = pride_size[-1]
         for lion in population[len(population) - nomad_size]:
-            lion_copy = copy.deepcopy(lion)
+            lion_copy = lion.copy()
             nomad_lions = np.append(nomad_lions, objects_to_array([lion_copy]))
 
         # Prides mating.
@@ -527,7 +545,7 @@ class LionOptimizationAlgorithm(Algorithm):
                 males = []
                 for lion in population[index_counter_pride:index_counter_pride + curr_pride_size]:
                     if lion.gender == "m":
-                        lion_copy = copy.deepcopy(lion)
+                        lion_copy = lion.copy()
                         males = np.append(males, objects_to_array([lion_copy]))
                 # Mate all females with a mating probability.
                 for lion in population[index_counter_pride:index_counter_pride + curr_pride_size]:
@@ -553,8 +571,8 @@ class LionOptimizationAlgorithm(Algorithm):
                             if self.random() < self.mutation_factor:
                                 offspring_two_position[i] = self.uniform(task.lower[i], task.upper[i], 1)
                         # Create offspring Lion objects
-                        offspring_one = copy.deepcopy(lion)
-                        offspring_two = copy.deepcopy(lion)
+                        offspring_one = lion.copy()
+                        offspring_two = lion.copy()
                         offspring_one.has_pride = True
                         offspring_two.has_pride = True
                         offspring_one.pride = pride_i
@@ -601,7 +619,7 @@ class LionOptimizationAlgorithm(Algorithm):
             males = []
             for lion in population[len(population) - nomad_size:]:
                 if lion.gender == "m":
-                    lion_copy = copy.deepcopy(lion)
+                    lion_copy = lion.copy()
                     males = np.append(males, objects_to_array([lion_copy]))
             # Mate all females with mating probability.
             for lion in population[len(population) - nomad_size:]:
@@ -623,8 +641,8 @@ class LionOptimizationAlgorithm(Algorithm):
                             offspring_two_position[i] = self.uniform(task.lower[i], task.upper[i])
 
                     # Create offspring Lion objects.
-                    offspring_one = copy.deepcopy(lion)
-                    offspring_two = copy.deepcopy(lion)
+                    offspring_one = lion.copy()
+                    offspring_two = lion.copy()
                     offspring_one.has_pride = False
                     offspring_two.has_pride = False
                     offspring_one.pride = -1
@@ -670,12 +688,12 @@ class LionOptimizationAlgorithm(Algorithm):
             # Append original pride lion.
             curr_original_pride_size = pride_size[pride_i] - excess_lion_gender_quantities[pride_i][0] - excess_lion_gender_quantities[pride_i][1]
             for lion in population[original_index_counter_pride:original_index_counter_pride + curr_original_pride_size]:
-                lion_copy = copy.deepcopy(lion)
+                lion_copy = lion.copy()
                 new_population = np.append(new_population, objects_to_array([lion_copy]))
             # Append cub pride lions.
             curr_cub_pride_size = excess_lion_gender_quantities[pride_i][0] + excess_lion_gender_quantities[pride_i][1]
             for lion in added_cubs[cub_index_counter_pride:cub_index_counter_pride + curr_cub_pride_size]:
-                lion_copy = copy.deepcopy(lion)
+                lion_copy = lion.copy()
                 new_population = np.append(new_population, objects_to_array([lion_copy]))
 
             original_index_counter_pride += curr_original_pride_size
@@ -683,11 +701,11 @@ class LionOptimizationAlgorithm(Algorithm):
         # Add nomad originals and cubs to same population.
         originals_nomad_size = pride_size[-1] - excess_lion_gender_quantities[-1][0] - excess_lion_gender_quantities[-1][1]
         for lion in population[len(population) - originals_nomad_size:]:
-            lion_copy = copy.deepcopy(lion)
+            lion_copy = lion.copy()
             new_population = np.append(new_population, objects_to_array([lion_copy]))
         cubs_nomad_size = excess_lion_gender_quantities[-1][0] + excess_lion_gender_quantities[-1][1]
         for lion in added_cubs[len(added_cubs) - cubs_nomad_size:]:
-            lion_copy = copy.deepcopy(lion)
+            lion_copy = lion.copy()
             new_population = np.append(new_population, objects_to_array([lion_copy]))
 
         return new_population, excess_lion_gender_quantities
@@ -719,7 +737,7 @@ class LionOptimizationAlgorithm(Algorithm):
             males = []
             # Go through pride
             for lion in population[index_counter_pride:index_counter_pride + curr_pride_size]:
-                lion_copy = copy.deepcopy(lion)
+                lion_copy = lion.copy()
                 if lion.gender == "m":
                     males = np.append(males, objects_to_array([lion_copy]))
                 elif lion.gender == "f":
@@ -727,7 +745,7 @@ class LionOptimizationAlgorithm(Algorithm):
             # Find males with worst fitness that will be kicked, leave the rest
             males = sorted(males, key=lambda lion: lion.current_f, reverse=True)
             for lion in males:
-                lion_copy = copy.deepcopy(lion)
+                lion_copy = lion.copy()
                 if num_of_males_to_be_kicked == 0:
                     original_pride_lions = np.append(original_pride_lions, objects_to_array([lion_copy]))
                 else:
@@ -739,16 +757,16 @@ class LionOptimizationAlgorithm(Algorithm):
         moved_population = []
         # Append original pride lions.
         for lion in original_pride_lions:
-            lion_copy = copy.deepcopy(lion)
+            lion_copy = lion.copy()
             moved_population = np.append(moved_population, objects_to_array([lion_copy]))
         # Append original nomads.
         original_nomads_size = pride_size[-1]
         for lion in population[len(population) - original_nomads_size:]:
-            lion_copy = copy.deepcopy(lion)
+            lion_copy = lion.copy()
             moved_population = np.append(moved_population, objects_to_array([lion_copy]))
         # Append new nomads.
         for lion in new_nomads:
-            lion_copy = copy.deepcopy(lion)
+            lion_copy = lion.copy()
 
             excess_lion_gender_quantities[lion_copy.pride][1] -= 1
             gender_distribution[lion_copy.pride][1] -= 1
@@ -782,8 +800,8 @@ class LionOptimizationAlgorithm(Algorithm):
                         if lion.gender == "m":
                             # Swap nomad and pride lion if nomad has better fitness.
                             if nomad_lion.current_f < pride_lion.current_f:
-                                copy_nomad_lion = copy.deepcopy(nomad_lion)
-                                copy_pride_lion = copy.deepcopy(pride_lion)
+                                copy_nomad_lion = nomad_lion.copy()
+                                copy_pride_lion = pride_lion.copy()
 
                                 pride_lion = copy_nomad_lion
                                 pride_lion.has_pride = True
@@ -832,7 +850,7 @@ class LionOptimizationAlgorithm(Algorithm):
             females = []
             # Go through pride
             for lion in population[index_counter_pride:index_counter_pride + curr_pride_size]:
-                lion_copy = copy.deepcopy(lion)
+                lion_copy = lion.copy()
                 if lion.gender == "m":
                     original_pride_lions = np.append(original_pride_lions, objects_to_array([lion_copy]))
                 elif lion.gender == "f":
@@ -844,7 +862,7 @@ class LionOptimizationAlgorithm(Algorithm):
             self.rng.shuffle(females_indices_to_migrate)
 
             for i, lion in enumerate(females):
-                lion_copy = copy.deepcopy(lion)
+                lion_copy = lion.copy()
                 if females_indices_to_migrate[i] == 1:
                     new_nomads = np.append(new_nomads, objects_to_array([lion_copy]))
                 else:
@@ -855,16 +873,16 @@ class LionOptimizationAlgorithm(Algorithm):
         moved_population = []
         # Append original pride lions
         for lion in original_pride_lions:
-            lion_copy = copy.deepcopy(lion)
+            lion_copy = lion.copy()
             moved_population = np.append(moved_population, objects_to_array([lion_copy]))
         # Append original nomads
         original_nomads_size = pride_size[-1]
         for lion in population[len(population) - original_nomads_size:]:
-            lion_copy = copy.deepcopy(lion)
+            lion_copy = lion.copy()
             moved_population = np.append(moved_population, objects_to_array([lion_copy]))
         # Append new nomads
         for lion in new_nomads:
-            lion_copy = copy.deepcopy(lion)
+            lion_copy = lion.copy()
 
             excess_lion_gender_quantities[lion_copy.pride][0] -= 1
             gender_distribution[lion_copy.pride][0] -= 1
@@ -888,7 +906,7 @@ class LionOptimizationAlgorithm(Algorithm):
         nomad_males = []
         original_nomads_size = pride_size[-1]
         for lion in moved_population[len(population) - original_nomads_size:]:
-            lion_copy = copy.deepcopy(lion)
+            lion_copy = lion.copy()
             if lion.gender == "f":
                 nomad_females = np.append(nomad_females, objects_to_array([lion_copy]))
             elif lion.gender == "m":
@@ -898,7 +916,7 @@ class LionOptimizationAlgorithm(Algorithm):
         nomad_females_to_keep = []
         counter = prides_spots_to_be_filled
         for lion in nomad_females:
-            lion_copy = copy.deepcopy(lion)
+            lion_copy = lion.copy()
             if not counter == 0:
                 nomad_females_to_move = np.append(nomad_females_to_move, objects_to_array([lion_copy]))
                 counter -= 1
@@ -914,12 +932,12 @@ class LionOptimizationAlgorithm(Algorithm):
             curr_pride_size = pride_size[pride_i]
             # Append pride lions
             for lion in moved_population[index_counter_pride:index_counter_pride + curr_pride_size]:
-                lion_copy = copy.deepcopy(lion)
+                lion_copy = lion.copy()
                 final_population = np.append(final_population, objects_to_array([lion_copy]))
             # Append female nomads
             curr_pride_spots_empty = np.abs(excess_lion_gender_quantities[pride_i][0])
             for lion in nomad_females_to_move[index_females_to_move:index_females_to_move + curr_pride_spots_empty]:
-                lion_copy = copy.deepcopy(lion)
+                lion_copy = lion.copy()
 
                 excess_lion_gender_quantities[lion_copy.pride][0] -= 1
                 gender_distribution[lion_copy.pride][0] -= 1
@@ -938,11 +956,11 @@ class LionOptimizationAlgorithm(Algorithm):
             index_females_to_move += curr_pride_spots_empty
         # Append the kept nomad females
         for lion in nomad_females_to_keep:
-            lion_copy = copy.deepcopy(lion)
+            lion_copy = lion.copy()
             final_population = np.append(final_population, objects_to_array([lion_copy]))
         # Append nomad males
         for lion in nomad_males:
-            lion_copy = copy.deepcopy(lion)
+            lion_copy = lion.copy()
             final_population = np.append(final_population, objects_to_array([lion_copy]))
         return final_population, excess_lion_gender_quantities
 
@@ -969,7 +987,7 @@ class LionOptimizationAlgorithm(Algorithm):
         original_nomads_size = pride_size[-1]
         # Get lists of nomad males and females.
         for lion in population[len(population) - original_nomads_size:]:
-            lion_copy = copy.deepcopy(lion)
+            lion_copy = lion.copy()
             if lion.gender == "f":
                 nomad_females = np.append(nomad_females, objects_to_array([lion_copy]))
             elif lion.gender == "m":
@@ -979,20 +997,20 @@ class LionOptimizationAlgorithm(Algorithm):
         nomad_females = sorted(nomad_females, key=lambda lion: lion.current_f, reverse=True)
         # Remove extra lions that have bad fitness, keep the rest.
         for lion in nomad_males[num_of_male_nomads_to_remove:]:
-            lion_copy = copy.deepcopy(lion)
+            lion_copy = lion.copy()
             kept_nomads = np.append(kept_nomads, objects_to_array([lion_copy]))
         for lion in nomad_females[num_of_female_nomads_to_remove:]:
-            lion_copy = copy.deepcopy(lion)
+            lion_copy = lion.copy()
             kept_nomads = np.append(kept_nomads, objects_to_array([lion_copy]))
 
         # Append pride lions to final population.
         final_population = []
         for lion in population[:len(population) - original_nomads_size]:
-            lion_copy = copy.deepcopy(lion)
+            lion_copy = lion.copy()
             final_population = np.append(final_population, objects_to_array([lion_copy]))
         # Append kept nomads to final population.
         for lion in kept_nomads:
-            lion_copy = copy.deepcopy(lion)
+            lion_copy = lion.copy()
             final_population = np.append(final_population, objects_to_array([lion_copy]))
         pride_size[-1] -= (num_of_female_nomads_to_remove + num_of_male_nomads_to_remove)
         gender_distribution[-1][0] -= num_of_female_nomads_to_remove
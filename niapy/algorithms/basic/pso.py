@@ -488,8 +488,7 @@ class OppositionVelocityClampingParticleSwarmOptimization(ParticleSwarmAlgorithm
         pop, fpop, _, _ = self.opposite_learning(s_l, s_h, pop, fpop, task)
         pb_indices = np.where(fpop < d['personal_best_fitness'])
         d['personal_best'][pb_indices], d['personal_best_fitness'][pb_indices] = pop[pb_indices], fpop[pb_indices]
-        d['min_velocity'], d['max_velocity'] = self.sigma * (task.upper - task.lower), self.sigma * (
-                task.lower - task.upper)
+        d['min_velocity'], d['max_velocity'] = self.sigma * task.range, -self.sigma * task.range
         d.update({'s_l': s_l, 's_h': s_h})
         return pop, fpop, d
 
@@ -0,0 +1,90 @@
+# encoding=utf8
+
+"""Hot loop helpers for the jDE algorithm.
+
+When numba is installed the trial construction below is compiled into a
+single fused kernel. The kernel is deliberately serial: numba's threading
+layers do not mix with the threads and forked processes users run algorithms
+under (parallel=True deadlocked TBB after a fork and crashed the workqueue
+layer under concurrent callers). Without numba, numexpr is used when available
+to evaluate the mutation/crossover expression in cache-sized tiles, and a
+branchless full-matrix NumPy variant serves as the final fallback. All variants only
+consume pre-drawn random numbers, so results do not depend on which one is
+active.
+
+A GPU backend (e.g. torch tensors on CUDA) was considered and rejected: the
+problems and tasks in this package evaluate on the host with NumPy, so the
+population would have to round-trip between device and host every
+generation, which costs more than the trial construction it would speed up.
+Offloading would only pay off with problems implemented as device-resident
+batched callables, which is outside the scope of this package.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+try:
+    import numexpr
+except ImportError:
+    numexpr = None
+
+__all__ = ['build_trial']
+
+
+def _build_trial_loop(pop, indices, uniforms, jrand, differential_weights, crossover_probabilities, trial):
+    for i in range(len(pop)):
+        mutant = pop[indices[i, 0]] + differential_weights[i] * (pop[indices[i, 1]] - pop[indices[i, 2]])
+        mask = uniforms[i] < crossover_probabilities[i]
+        mask[jrand[i]] = True
+        trial[i] = np.where(mask, mutant, pop[i])
+    return trial
+
+
+def _build_trial_numpy(pop, indices, uniforms, jrand, differential_weights, crossover_probabilities, trial):
+    mutant = pop[indices[:, 0]] + differential_weights[:, np.newaxis] * (pop[indices[:, 1]] - pop[indices[:, 2]])
+    mask = uniforms < crossover_probabilities[:, np.newaxis]
+    mask[np.arange(len(pop)), jrand] = True
+    np.copyto(trial, np.where(mask, mutant, pop))
+    return trial
+
+
+def _build_trial_numexpr(pop, indices, uniforms, jrand, differential_weights, crossover_probabilities, trial):
+    mask = uniforms < crossover_probabilities[:, np.newaxis]
+    mask[np.arange(len(pop)), jrand] = True
+    numexpr.evaluate('where(mask, a + f * (b - c), pop)',
+                     local_dict={'mask': mask, 'pop': pop,
+                                 'a': pop[indices[:, 0]], 'b': pop[indices[:, 1]], 'c': pop[indices[:, 2]],
+                                 'f': differential_weights[:, np.newaxis]},
+                     out=trial)
+    return trial
+
+
+def build_trial(pop, indices, uniforms, jrand, differential_weights, crossover_probabilities, trial):
+    r"""Build a DE/rand/1/bin trial population from pre-drawn random numbers.
+
+    Args:
+        pop (numpy.ndarray): Current population with shape `(population_size, dimension)`.
+        indices (numpy.ndarray): Three distinct mutation indices per individual with shape `(population_size, 3)`.
+        uniforms (numpy.ndarray): Uniform crossover draws with shape `(population_size, dimension)`.
+        jrand (numpy.ndarray): Index of the dimension that always crosses over, per individual.
+        differential_weights (numpy.ndarray): Scale factor of each individual.
+        crossover_probabilities (numpy.ndarray): Crossover probability of each individual.
+        trial (numpy.ndarray): Preallocated output buffer with shape `(population_size, dimension)`.
+
+    Returns:
+        numpy.ndarray: Trial population with shape `(population_size, dimension)`.
+
+    """
+    return _build_trial(pop, indices, uniforms, jrand, differential_weights, crossover_probabilities, trial)
+
+
+if njit is not None:
+    _build_trial = njit(cache=True)(_build_trial_loop)
+elif numexpr is not None:
+    _build_trial = _build_trial_numexpr
+else:
+    _build_trial = _build_trial_numpy
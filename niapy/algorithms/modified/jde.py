@@ -1,50 +1,23 @@
 # encoding=utf8
 import logging
 
-from niapy.algorithms.algorithm import Individual
+import numpy as np
+
+from niapy.algorithms.algorithm import default_numpy_init
 from niapy.algorithms.basic.de import DifferentialEvolution, cross_best1, cross_rand1, cross_curr2best1, cross_best2, \
-    cross_curr2rand1, multi_mutations
-from niapy.util import objects_to_array
+    cross_curr2rand1
+from niapy.algorithms.modified._jde_kernels import build_trial
 
 logging.basicConfig()
 logger = logging.getLogger('niapy.algorithms.modified')
 logger.setLevel('INFO')
 
 __all__ = [
-    'SolutionJDE',
     'SelfAdaptiveDifferentialEvolution',
     'MultiStrategySelfAdaptiveDifferentialEvolution',
 ]
 
 
-class SolutionJDE(Individual):
-    r"""Individual for jDE algorithm.
-
-    Attributes:
-        differential_weight (float): Scale factor.
-        crossover_probability (float): Crossover probability.
-
-    See Also:
-        :class:`niapy.algorithms.Individual`
-
-    """
-
-    def __init__(self, differential_weight=2, crossover_probability=0.5, **kwargs):
-        r"""Initialize SolutionJDE.
-
-        Attributes:
-            differential_weight (float): Scale factor.
-            crossover_probability (float): Crossover probability.
-
-        See Also:
-            :func:`niapy.algorithm.Individual.__init__`
-
-        """
-        super().__init__(**kwargs)
-        self.differential_weight = differential_weight
-        self.crossover_probability = crossover_probability
-
-
 class SelfAdaptiveDifferentialEvolution(DifferentialEvolution):
     r"""Implementation of Self-adaptive differential evolution algorithm.
 
@@ -103,7 +76,8 @@ class SelfAdaptiveDifferentialEvolution(DifferentialEvolution):
             * :func:`niapy.algorithms.basic.DifferentialEvolution.__init__`
 
         """
-        super().__init__(individual_type=kwargs.pop('individual_type', SolutionJDE), *args, **kwargs)
+        super().__init__(initialization_function=kwargs.pop('initialization_function', default_numpy_init),
+                         individual_type=kwargs.pop('individual_type', None), *args, **kwargs)
         self.f_lower = f_lower
         self.f_upper = f_upper
         self.tao1 = tao1
@@ -122,7 +96,8 @@ class SelfAdaptiveDifferentialEvolution(DifferentialEvolution):
             * :func:`niapy.algorithms.basic.DifferentialEvolution.set_parameters`
 
         """
-        super().set_parameters(individual_type=kwargs.pop('individual_type', SolutionJDE), **kwargs)
+        super().set_parameters(initialization_function=kwargs.pop('initialization_function', default_numpy_init),
+                               individual_type=kwargs.pop('individual_type', None), **kwargs)
         self.f_lower = f_lower
         self.f_upper = f_upper
         self.tao1 = tao1
@@ -144,38 +119,158 @@ class SelfAdaptiveDifferentialEvolution(DifferentialEvolution):
         })
         return d
 
-    def adaptive_gen(self, x):
-        r"""Adaptive update scale factor in crossover probability.
+    def init_population(self, task):
+        r"""Initialize starting population and per individual control parameters.
+
+        Args:
+            task (Task): Optimization task.
+
+        Returns:
+            Tuple[numpy.ndarray, numpy.ndarray, Dict[str, Any]]:
+                1. New population with shape `(population_size, task.dimension)`.
+                2. New population fitness values.
+                3. Additional arguments:
+                    * differential_weights (numpy.ndarray): Scale factor of each individual.
+                    * crossover_probabilities (numpy.ndarray): Crossover probability of each individual.
+
+        See Also:
+            * :func:`niapy.algorithms.basic.DifferentialEvolution.init_population`
+
+        """
+        population, fitness, d = super().init_population(task)
+        d.update({
+            'differential_weights': np.full(self.population_size, self.differential_weight),
+            'crossover_probabilities': np.full(self.population_size, self.crossover_probability),
+            'trial_population': np.empty_like(population)
+        })
+        return population, fitness, d
+
+    def adapt_parameters(self, differential_weights, crossover_probabilities):
+        r"""Adapt scale factors and crossover probabilities of the population.
 
         Args:
-            x (IndividualJDE): Individual to apply function on.
+            differential_weights (numpy.ndarray): Current scale factors.
+            crossover_probabilities (numpy.ndarray): Current crossover probabilities.
 
         Returns:
-            Individual: New individual with new parameters
+            Tuple[numpy.ndarray, numpy.ndarray]:
+                1. New scale factors.
+                2. New crossover probabilities.
 
         """
-        f = self.f_lower + self.random() * (self.f_upper - self.f_lower) if self.random() < self.tao1 else x.differential_weight
-        cr = self.random() if self.random() < self.tao2 else x.crossover_probability
-        return self.individual_type(x=x.x, differential_weight=f, crossover_probability=cr, e=False)
+        n = len(differential_weights)
+        new_weights = np.where(self.random(n) < self.tao1,
+                               self.f_lower + self.random(n) * (self.f_upper - self.f_lower),
+                               differential_weights)
+        new_probabilities = np.where(self.random(n) < self.tao2, self.random(n), crossover_probabilities)
+        return new_weights, new_probabilities
+
+    def mutation_indices(self, population_size):
+        r"""Draw three distinct mutation indices, different from the own index, for every individual.
+
+        Indices are drawn in `[0, population_size - 1)` and shifted up by one
+        where they reach the own index, so no rejection test against the own
+        index is needed; only the rare duplicates within a row are resampled.
+
+        Args:
+            population_size (int): Number of individuals in population.
+
+        Returns:
+            numpy.ndarray: Mutation indices with shape `(population_size, 3)`.
 
-    def evolve(self, pop, xb, task, **_kwargs):
+        """
+        own = np.arange(population_size)[:, np.newaxis]
+        indices = self.rng.integers(population_size - 1, size=(population_size, 3))
+        indices += indices >= own
+        while True:
+            duplicates = (indices[:, 0] == indices[:, 1]) | (indices[:, 0] == indices[:, 2]) | \
+                (indices[:, 1] == indices[:, 2])
+            if not duplicates.any():
+                return indices
+            resampled = self.rng.integers(population_size - 1, size=(np.sum(duplicates), 3))
+            resampled += resampled >= own[duplicates]
+            indices[duplicates] = resampled
+
+    def evolve(self, pop, xb, task, differential_weights=None, crossover_probabilities=None, trial_population=None,
+               **_kwargs):
         r"""Evolve current population.
 
         Args:
-            pop (numpy.ndarray[Individual]): Current population.
-            xb (Individual): Global best individual.
+            pop (numpy.ndarray): Current population with shape `(population_size, task.dimension)`.
+            xb (numpy.ndarray): Global best solution.
             task (Task): Optimization task.
+            differential_weights (numpy.ndarray): Scale factor of each individual.
+            crossover_probabilities (numpy.ndarray): Crossover probability of each individual.
+            trial_population (Optional[numpy.ndarray]): Preallocated buffer the trial population is written into.
 
         Returns:
-            numpy.ndarray: New population.
+            Tuple[numpy.ndarray, numpy.ndarray]:
+                1. Trial population.
+                2. Trial population fitness values.
 
         """
-        new_pop = objects_to_array([self.adaptive_gen(e) for e in pop])
-        for i, e in enumerate(new_pop):
-            new_pop[i].x = self.strategy(new_pop, i, e.differential_weight, e.crossover_probability, rng=self.rng, x_b=xb)
-        for e in new_pop:
-            e.evaluate(task, rng=self.random)
-        return new_pop
+        if trial_population is None:
+            trial_population = np.empty_like(pop)
+        if self.strategy is cross_rand1 and len(pop) > 3:
+            indices = self.mutation_indices(len(pop))
+            uniforms = self.random((len(pop), task.dimension))
+            jrand = self.rng.integers(task.dimension, size=len(pop))
+            build_trial(pop, indices, uniforms, jrand, differential_weights, crossover_probabilities,
+                        trial_population)
+            trial_population = task.repair(trial_population, rng=self.rng)
+        else:
+            for i in range(len(pop)):
+                trial = self.strategy(pop, i, differential_weights[i], crossover_probabilities[i], self.rng, x_b=xb)
+                trial_population[i] = task.repair(trial, rng=self.rng)
+        trial_fitness = task.eval_batch(trial_population)
+        return trial_population, trial_fitness
+
+    def run_iteration(self, task, population, population_fitness, best_x, best_fitness, **params):
+        r"""Core function of Self-adaptive differential evolution algorithm.
+
+        Args:
+            task (Task): Optimization task.
+            population (numpy.ndarray): Current population.
+            population_fitness (numpy.ndarray): Current populations fitness/function values.
+            best_x (numpy.ndarray): Current best individual.
+            best_fitness (float): Current best individual function/fitness value.
+            **params (dict): Additional arguments.
+
+        Returns:
+            Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray, float, Dict[str, Any]]:
+                1. New population.
+                2. New population fitness/function values.
+                3. New global best solution.
+                4. New global best solutions fitness/objective value.
+                5. Additional arguments:
+                    * differential_weights (numpy.ndarray): Scale factor of each individual.
+                    * crossover_probabilities (numpy.ndarray): Crossover probability of each individual.
+
+        See Also:
+            * :func:`niapy.algorithms.modified.SelfAdaptiveDifferentialEvolution.evolve`
+            * :func:`niapy.algorithms.modified.SelfAdaptiveDifferentialEvolution.adapt_parameters`
+
+        """
+        differential_weights = params.pop('differential_weights')
+        crossover_probabilities = params.pop('crossover_probabilities')
+        trial_buffer = params.pop('trial_population', None)
+
+        new_weights, new_probabilities = self.adapt_parameters(differential_weights, crossover_probabilities)
+        trial_population, trial_fitness = self.evolve(population, best_x, task, differential_weights=new_weights,
+                                                      crossover_probabilities=new_probabilities,
+                                                      trial_population=trial_buffer)
+        improved = trial_fitness < population_fitness
+        population[improved] = trial_population[improved]
+        population_fitness[improved] = trial_fitness[improved]
+        differential_weights = np.where(improved, new_weights, differential_weights)
+        crossover_probabilities = np.where(improved, new_probabilities, crossover_probabilities)
+
+        best_x, best_fitness = self.get_best(population, population_fitness, best_x, best_fitness)
+        return population, population_fitness, best_x, best_fitness, {
+            'differential_weights': differential_weights,
+            'crossover_probabilities': crossover_probabilities,
+            'trial_population': trial_population
+        }
 
 
 class MultiStrategySelfAdaptiveDifferentialEvolution(SelfAdaptiveDifferentialEvolution):
@@ -195,6 +290,7 @@ class MultiStrategySelfAdaptiveDifferentialEvolution(SelfAdaptiveDifferentialEvo
 
     Attributes:
         Name (List[str]): List of strings representing algorithm name
+        strategies (Iterable[Callable]): Mutations strategies to use in algorithm.
 
     See Also:
         * :class:`niapy.algorithms.modified.SelfAdaptiveDifferentialEvolution`
@@ -214,7 +310,7 @@ class MultiStrategySelfAdaptiveDifferentialEvolution(SelfAdaptiveDifferentialEvo
             * :func:`niapy.algorithms.modified.SelfAdaptiveDifferentialEvolution.__init__`
 
         """
-        super().__init__(strategy=kwargs.pop('strategy', multi_mutations), *args, **kwargs)
+        super().__init__(*args, **kwargs)
         self.strategies = strategies
 
     def set_parameters(self, strategies=(cross_curr2rand1, cross_curr2best1, cross_rand1, cross_best1, cross_best2),
@@ -228,7 +324,7 @@ class MultiStrategySelfAdaptiveDifferentialEvolution(SelfAdaptiveDifferentialEvo
             * :func:`niapy.algorithms.modified.SelfAdaptiveDifferentialEvolution.set_parameters`
 
         """
-        super().set_parameters(strategy=kwargs.pop('strategy', multi_mutations), **kwargs)
+        super().set_parameters(**kwargs)
         self.strategies = strategies
 
     def get_parameters(self):
@@ -242,18 +338,40 @@ class MultiStrategySelfAdaptiveDifferentialEvolution(SelfAdaptiveDifferentialEvo
         params.update({'strategies': self.strategies})
         return params
 
-    def evolve(self, pop, xb, task, **kwargs):
-        r"""Evolve population with the help multiple mutation strategies.
+    def evolve(self, pop, xb, task, differential_weights=None, crossover_probabilities=None, trial_population=None,
+               **_kwargs):
+        r"""Evolve population with the help of multiple mutation strategies.
+
+        For each individual every mutation strategy is applied and the best of the produced
+        trial solutions is kept. Candidates are stored per strategy as whole populations,
+        so repair and evaluation run on `(population_size, task.dimension)` batches instead
+        of one solution at a time.
 
         Args:
-            pop (numpy.ndarray[Individual]): Current population.
-            xb (Individual): Current best individual.
+            pop (numpy.ndarray): Current population with shape `(population_size, task.dimension)`.
+            xb (numpy.ndarray): Global best solution.
             task (Task): Optimization task.
+            differential_weights (numpy.ndarray): Scale factor of each individual.
+            crossover_probabilities (numpy.ndarray): Crossover probability of each individual.
+            trial_population (Optional[numpy.ndarray]): Preallocated buffer the trial population is written into.
 
         Returns:
-            numpy.ndarray[Individual]: New population of individuals.
+            Tuple[numpy.ndarray, numpy.ndarray]:
+                1. Trial population.
+                2. Trial population fitness values.
 
         """
-        return objects_to_array(
-            [self.strategy(pop, i, xb, self.differential_weight, self.crossover_probability, self.rng, task, self.individual_type, self.strategies) for i in
-             range(len(pop))])
+        if trial_population is None:
+            trial_population = np.empty_like(pop)
+        candidates = np.empty((len(self.strategies), len(pop), task.dimension))
+        candidates_fitness = np.empty((len(self.strategies), len(pop)))
+        for s, strategy in enumerate(self.strategies):
+            for i in range(len(pop)):
+                candidates[s, i] = strategy(pop, i, differential_weights[i], crossover_probabilities[i], self.rng,
+                                            x_b=xb)
+            candidates[s] = task.repair(candidates[s], rng=self.rng)
+            candidates_fitness[s] = task.eval_batch(candidates[s])
+        best = np.argmin(candidates_fitness, axis=0)
+        rows = np.arange(len(pop))
+        trial_population[:] = candidates[best, rows]
+        return trial_population, candidates_fitness[best, rows]
@@ -89,3 +89,12 @@ class Ackley(Problem):
         temp2 = val2 / self.dimension
 
         return -self.a * np.exp(temp1) - np.exp(temp2) + self.a + np.exp(1)
+
+    def _evaluate_batch(self, x):
+        val1 = np.sum(np.square(x), axis=-1)
+        val2 = np.sum(np.cos(self.c * x), axis=-1)
+
+        temp1 = -self.b * np.sqrt(val1 / self.dimension)
+        temp2 = val2 / self.dimension
+
+        return -self.a * np.exp(temp1) - np.exp(temp2) + self.a + np.exp(1)
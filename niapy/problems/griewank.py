@@ -77,6 +77,12 @@ class Griewank(Problem):
         val2 = np.product(np.cos(x / np.sqrt(i)))
         return val1 - val2 + 1.0
 
+    def _evaluate_batch(self, x):
+        val1 = np.sum(x * x / 4000.0, axis=-1)
+        i = np.arange(1, self.dimension + 1)
+        val2 = np.prod(np.cos(x / np.sqrt(i)), axis=-1)
+        return val1 - val2 + 1.0
+
 
 class ExpandedGriewankPlusRosenbrock(Problem):
     r"""Implementation of Expanded Griewank's plus Rosenbrock function.
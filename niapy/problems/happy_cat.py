@@ -78,3 +78,8 @@ class HappyCat(Problem):
         val1 = np.sum(np.abs(x * x - self.dimension) ** self.alpha)
         val2 = np.sum((0.5 * x * x + x) / self.dimension)
         return val1 + val2 + 0.5
+
+    def _evaluate_batch(self, x):
+        val1 = np.sum(np.abs(x * x - self.dimension) ** self.alpha, axis=-1)
+        val2 = np.sum((0.5 * x * x + x) / self.dimension, axis=-1)
+        return val1 + val2 + 0.5
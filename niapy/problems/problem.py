@@ -4,6 +4,9 @@
 
 from abc import ABC, abstractmethod
 import logging
+
+import numpy as np
+
 from niapy.util.array import full_array
 
 logging.basicConfig()
@@ -16,6 +19,11 @@ __all__ = ['Problem']
 class Problem(ABC):
     r"""Class representing an optimization problem.
 
+    All problem state lives on the instance — subclasses must not stash the
+    objective or other mutable data in class attributes, so that concurrent
+    tasks (e.g. parallel Runner repetitions) never share state through the
+    class object.
+
     Attributes:
         dimension (int): Dimension of the problem.
         lower (numpy.ndarray): Lower bounds of the problem.
@@ -56,6 +64,30 @@ class Problem(ABC):
 
         return self._evaluate(x)
 
+    def _evaluate_batch(self, x):
+        """Evaluate a batch of solutions row by row."""
+        return np.apply_along_axis(self._evaluate, 1, x)
+
+    def evaluate_batch(self, x):
+        """Evaluate a batch of solutions.
+
+        The base implementation evaluates each row separately. Problems whose
+        function can be expressed with array operations override
+        ``_evaluate_batch`` and compute the whole batch with reductions over
+        the last axis.
+
+        Args:
+            x (numpy.ndarray): Array of solutions with shape `(batch_size, dimension)`.
+
+        Returns:
+            numpy.ndarray: Function values of the rows of `x`.
+
+        """
+        if x.shape[-1] != self.dimension:
+            raise ValueError('Dimensions do not match. {} != {}'.format(x.shape[-1], self.dimension))
+
+        return self._evaluate_batch(x)
+
     def __call__(self, x):
         r"""Evaluate solution.
 
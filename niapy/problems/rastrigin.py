@@ -70,3 +70,6 @@ class Rastrigin(Problem):
 
     def _evaluate(self, x):
         return 10.0 * self.dimension + np.sum(x * x - 10.0 * np.cos(2 * np.pi * x))
+
+    def _evaluate_batch(self, x):
+        return 10.0 * self.dimension + np.sum(x * x - 10.0 * np.cos(2 * np.pi * x), axis=-1)
@@ -72,6 +72,9 @@ class Sphere(Problem):
     def _evaluate(self, x):
         return np.sum(x ** 2)
 
+    def _evaluate_batch(self, x):
+        return np.sum(x ** 2, axis=-1)
+
 
 class Sphere2(Problem):
     r"""Implementation of Sphere with different powers function.
@@ -4,13 +4,16 @@
 
 import datetime
 import logging
+import multiprocessing
 import os
 
+import numpy as np
 import pandas as pd
+from numpy.random import default_rng
 
 from niapy.algorithms.algorithm import Algorithm
 from niapy.task import Task
-from niapy.util.factory import get_algorithm
+from niapy.util.factory import get_algorithm, get_problem
 
 logging.basicConfig()
 logger = logging.getLogger('niapy.runner.Runner')
@@ -19,6 +22,22 @@ logger.setLevel('INFO')
 __all__ = ["Runner"]
 
 
+def _run_algorithm(algorithm, task, seed):
+    r"""Run a single repetition with an independently seeded generator.
+
+    Args:
+        algorithm (Algorithm): Algorithm to run.
+        task (Task): Optimization task.
+        seed (numpy.random.SeedSequence): Seed for the random generator of this run.
+
+    Returns:
+        Tuple[numpy.ndarray, float]: Best solution and its fitness value.
+
+    """
+    algorithm.rng = default_rng(seed)
+    return algorithm.run(task)
+
+
 class Runner:
     r"""Runner utility feature.
 
@@ -35,7 +54,7 @@ class Runner:
     """
 
     def __init__(self, dimension=10, max_evals=1000000, runs=1, algorithms='ArtificialBeeColonyAlgorithm',
-                 problems='Ackley'):
+                 problems='Ackley', n_jobs=1):
         r"""Initialize Runner.
 
         Args:
@@ -44,6 +63,12 @@ class Runner:
             runs (int): Number of repetitions
             algorithms (List[Algorithm]): List of algorithms to run
             problems (List[Union[str, Problem]]): List of problems to run
+            n_jobs (int): Number of processes to distribute the repetitions over.
+                With the default of 1 all runs execute in the calling process;
+                a non-positive value uses all available cores. In parallel mode
+                every run gets an independently seeded random generator. Workers
+                are spawned rather than forked, so the pool stays safe after
+                algorithms with compiled or threaded kernels ran in this process.
 
         """
         self.dimension = dimension
@@ -51,19 +76,38 @@ class Runner:
         self.runs = runs
         self.algorithms = algorithms
         self.problems = problems
+        self.n_jobs = n_jobs
         self.results = {}
+        self._records = []
 
-    def task_factory(self, name):
+    def task_factory(self, problem):
         r"""Create optimization task.
 
         Args:
-            name (str): Problem name.
+            problem (Union[str, Problem]): Problem name or an already built problem instance.
 
         Returns:
             Task: Optimization task to use.
 
         """
-        return Task(max_evals=self.max_evals, dimension=self.dimension, problem=name)
+        if isinstance(problem, str):
+            return Task(max_evals=self.max_evals, dimension=self.dimension, problem=problem)
+        return Task(max_evals=self.max_evals, problem=problem)
+
+    def _record(self, alg_name, problem_name, run, result):
+        r"""Append one finished run to the flat export records.
+
+        Args:
+            alg_name (str): Algorithm name.
+            problem_name (str): Problem name.
+            run (int): Index of the repetition.
+            result (Tuple[numpy.ndarray, float]): Best solution and its fitness value.
+
+        """
+        self._records.append({'algorithm': alg_name, 'problem': problem_name, 'run': run, 'best_fitness': result[1]})
+
+    def _records_to_dataframe(self):
+        return pd.DataFrame(self._records, columns=['algorithm', 'problem', 'run', 'best_fitness'])
 
     @classmethod
     def __create_export_dir(cls):
@@ -76,17 +120,17 @@ class Runner:
         return "export/" + str(datetime.datetime.now()).replace(":", ".") + "." + extension
 
     def __export_to_dataframe_pickle(self):
-        dataframe = pd.DataFrame.from_dict(self.results)
+        dataframe = self._records_to_dataframe()
         dataframe.to_pickle(self.__generate_export_name("pkl"))
         logger.info("Export to Pandas DataFrame pickle (pkl) completed!")
 
     def __export_to_json(self):
-        dataframe = pd.DataFrame.from_dict(self.results)
+        dataframe = self._records_to_dataframe()
         dataframe.to_json(self.__generate_export_name("json"))
         logger.info("Export to JSON file completed!")
 
     def __export_to_xlsx(self):
-        dataframe = pd.DataFrame.from_dict(self.results)
+        dataframe = self._records_to_dataframe()
         dataframe.to_excel(self.__generate_export_name("xlsx"))
         logger.info("Export to XLSX file completed!")
 
@@ -104,11 +148,14 @@ class Runner:
             TypeError: Raises TypeError if export type is not supported
 
         """
+        self._records = []
         for alg in self.algorithms:
-            if not isinstance(alg, "".__class__):
+            if isinstance(alg, Algorithm):
                 alg_name = str(type(alg).__name__)
+                algorithm = alg
             else:
                 alg_name = alg
+                algorithm = get_algorithm(alg)
 
             self.results[alg_name] = {}
 
@@ -116,22 +163,31 @@ class Runner:
                 logger.info("Running %s...", alg_name)
 
             for problem in self.problems:
-                if not isinstance(problem, "".__class__):
-                    problem_name = str(type(problem).__name__)
-                else:
+                if isinstance(problem, "".__class__):
                     problem_name = problem
+                    problem = get_problem(problem, dimension=self.dimension)
+                else:
+                    problem_name = str(type(problem).__name__)
 
                 if verbose:
                     logger.info("Running %s algorithm on %s problem...", alg_name, problem_name)
 
-                self.results[alg_name][problem_name] = []
-                for _ in range(self.runs):
-                    if isinstance(alg, Algorithm):
-                        algorithm = alg
-                    else:
-                        algorithm = get_algorithm(alg)
-                    task = self.task_factory(problem)
-                    self.results[alg_name][problem_name].append(algorithm.run(task))
+                if self.n_jobs == 1:
+                    self.results[alg_name][problem_name] = []
+                    for run in range(self.runs):
+                        task = self.task_factory(problem)
+                        result = algorithm.run(task)
+                        self.results[alg_name][problem_name].append(result)
+                        self._record(alg_name, problem_name, run, result)
+                else:
+                    tasks = [self.task_factory(problem) for _ in range(self.runs)]
+                    seeds = np.random.SeedSequence().spawn(self.runs)
+                    context = multiprocessing.get_context('spawn')
+                    with context.Pool(self.n_jobs if self.n_jobs > 0 else None) as pool:
+                        self.results[alg_name][problem_name] = pool.starmap(
+                            _run_algorithm, zip([algorithm] * self.runs, tasks, seeds))
+                    for run, result in enumerate(self.results[alg_name][problem_name]):
+                        self._record(alg_name, problem_name, run, result)
             if verbose:
                 logger.info("---------------------------------------------------")
         if export == "dataframe":
@@ -152,6 +152,54 @@ class Task:
                 logger.info('evals:%d => %s' % (self.evals, self.x_f))
         return x_f
 
+    def eval_batch(self, population):
+        r"""Evaluate a batch of solutions.
+
+        The whole batch is passed to the problem in one call when the problem
+        implements a vectorized :func:`niapy.problems.Problem._evaluate_batch`,
+        replacing one Python level call per solution with a single array
+        operation. For problems without one, each row is delegated to
+        :func:`niapy.task.Task.eval`, so subclasses that override ``eval``
+        keep their behavior on the batch path. Book-keeping of evaluations
+        and improvements is identical to calling ``eval`` on each row; rows
+        past the stopping condition get a fitness of infinity and are not
+        counted.
+
+        Args:
+            population (numpy.ndarray): Solutions to evaluate with shape `(batch_size, dimension)`.
+
+        Returns:
+            numpy.ndarray: Fitness/function values of the rows of `population`.
+
+        See Also:
+            * :func:`niapy.task.Task.eval`
+            * :func:`niapy.problems.Problem.evaluate_batch`
+
+        """
+        if type(self.problem)._evaluate_batch is Problem._evaluate_batch:
+            return np.asarray([self.eval(x) for x in population])
+        fitness = np.full(len(population), np.inf)
+        n = len(population)
+        if np.isfinite(self.max_evals):
+            n = min(n, int(self.max_evals) - self.evals)
+        if n <= 0 or self.stopping_condition():
+            return fitness
+        values = self.problem.evaluate_batch(population[:n]) * self.optimization_type.value
+
+        for i in range(n):
+            if self.stopping_condition():
+                break
+            self.evals += 1
+            x_f = values[i]
+            if x_f < self.x_f * self.optimization_type.value:
+                self.x_f = x_f * self.optimization_type.value
+                self.n_evals.append(self.evals)
+                self.fitness_evals.append(x_f)
+                if self.enable_logging:
+                    logger.info('evals:%d => %s' % (self.evals, self.x_f))
+            fitness[i] = x_f
+        return fitness
+
     def is_feasible(self, x):
         r"""Check if the solution is feasible.
 
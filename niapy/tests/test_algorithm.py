@@ -256,6 +256,12 @@ class TestingTask(Task, TestCase):
         self.assertTrue(self.is_feasible(x), 'Solution %s is not in feasible space!!!' % x)
         return super().eval(x)
 
+    def eval_batch(self, population):
+        r"""Check if is algorithm trying to evaluate solutions out of bounds."""
+        for x in population:
+            self.assertTrue(self.is_feasible(x), 'Solution %s is not in feasible space!!!' % x)
+        return super().eval_batch(population)
+
 
 class AlgorithmTestCase(TestCase):
     r"""Base class for testing other algorithms.
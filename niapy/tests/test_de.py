@@ -1,8 +1,11 @@
 # encoding=utf8
 
+import numpy as np
+
 from niapy.algorithms.basic import DifferentialEvolution, DynNpDifferentialEvolution, AgingNpDifferentialEvolution, \
     MultiStrategyDifferentialEvolution, DynNpMultiStrategyDifferentialEvolution
 from niapy.algorithms.basic.de import cross_rand1, cross_rand2, cross_best1, cross_best2, cross_curr2rand1, cross_curr2best1
+from niapy.task import Task
 from niapy.tests.test_algorithm import AlgorithmTestCase, MyProblem
 
 
@@ -83,6 +86,18 @@ class ANpDETestCase(AlgorithmTestCase):
         de_griewankc = self.algo(population_size=10, crossover_probability=0.5, differential_weight=0.9, seed=self.seed)
         AlgorithmTestCase.test_algorithm_run(self, de_griewank, de_griewankc, 'griewank')
 
+    def test_extinction_updates_best(self):
+        """Individuals injected by aging() on full extinction must update the best-so-far pair."""
+        algo = self.algo(population_size=10, min_lifetime=0, max_lifetime=0, seed=self.seed)
+        task = Task(problem=MyProblem(), max_evals=10000)
+        population, _, _ = algo.init_population(task)
+        for individual in population:
+            individual.age = 1000
+            individual.f = 9e99
+        population, best_x, best_fitness = algo.selection(population, population, population[0].x, np.inf, task=task)
+        fitness = np.asarray([individual.f for individual in population])
+        self.assertLessEqual(best_fitness, fitness.min())
+
 
 class MsDETestCase(AlgorithmTestCase):
     def setUp(self):
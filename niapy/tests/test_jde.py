@@ -1,33 +1,58 @@
 # encoding=utf8
-from unittest import TestCase
+from unittest import TestCase, skipIf
 
-from numpy.random import default_rng
+import numpy as np
 
 from niapy.algorithms.modified import SelfAdaptiveDifferentialEvolution, \
     MultiStrategySelfAdaptiveDifferentialEvolution
-from niapy.algorithms.modified.jde import SolutionJDE
-from niapy.task import Task
+from niapy.algorithms.modified import _jde_kernels
 from niapy.tests.test_algorithm import AlgorithmTestCase, MyProblem
 
 
-class SolutionJDETestCase(TestCase):
+class BuildTrialTestCase(TestCase):
+    r"""Check that every `_build_trial` variant produces identical trials from the same random draws."""
+
     def setUp(self):
-        self.D, self.F, self.CR = 10, 0.9, 0.3
-        self.x, self.task = default_rng().uniform(10, 50, self.D), Task(problem=MyProblem(self.D))
-        self.s1, self.s2 = SolutionJDE(task=self.task, e=False), SolutionJDE(differential_weight=self.F,
-                                                                             crossover_probability=self.CR, x=self.x)
+        rng = np.random.default_rng(1234)
+        population_size, dimension = 20, 8
+        self.pop = rng.uniform(-5.0, 5.0, (population_size, dimension))
+        own = np.arange(population_size)[:, np.newaxis]
+        self.indices = rng.integers(population_size - 1, size=(population_size, 3))
+        self.indices += self.indices >= own
+        self.uniforms = rng.random((population_size, dimension))
+        self.jrand = rng.integers(dimension, size=population_size)
+        self.weights = rng.random(population_size)
+        self.probabilities = rng.random(population_size)
+        self.expected = _jde_kernels._build_trial_loop(self.pop, self.indices, self.uniforms, self.jrand,
+                                                       self.weights, self.probabilities, np.empty_like(self.pop))
+
+    def assert_matches_loop(self, variant):
+        trial = variant(self.pop, self.indices, self.uniforms, self.jrand, self.weights, self.probabilities,
+                        np.empty_like(self.pop))
+        self.assertTrue(np.array_equal(self.expected, trial))
 
-    def test_F(self):
-        self.assertAlmostEqual(self.s1.differential_weight, 2)
-        self.assertAlmostEqual(self.s2.differential_weight, self.F)
+    def test_numpy_matches_loop(self):
+        self.assert_matches_loop(_jde_kernels._build_trial_numpy)
 
-    def test_cr(self):
-        self.assertAlmostEqual(self.s1.crossover_probability, 0.5)
-        self.assertAlmostEqual(self.s2.crossover_probability, self.CR)
+    @skipIf(_jde_kernels.njit is None, 'numba is not installed')
+    def test_numba_matches_loop(self):
+        self.assert_matches_loop(_jde_kernels._build_trial)
+
+    @skipIf(_jde_kernels.numexpr is None, 'numexpr is not installed')
+    def test_numexpr_matches_loop(self):
+        self.assert_matches_loop(_jde_kernels._build_trial_numexpr)
 
 
 class JDETestCase(AlgorithmTestCase):
 
+    def test_mutation_indices(self):
+        algo = SelfAdaptiveDifferentialEvolution(seed=self.seed)
+        indices = algo.mutation_indices(10)
+        self.assertEqual((10, 3), indices.shape)
+        for i, row in enumerate(indices):
+            self.assertNotIn(i, row)
+            self.assertEqual(3, len(set(row)))
+
     def test_custom(self):
         jde_custom = SelfAdaptiveDifferentialEvolution(f_lower=0.0, f_upper=2.0, tao1=0.9, tao2=0.45,
                                                        population_size=10, differential_weight=0.5,
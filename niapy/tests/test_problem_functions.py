@@ -266,3 +266,11 @@ class TestProblemFunctions(TestCase):
         """Test the cosine mixture function."""
         fun = get_problem('cosine_mixture', dimension=2, lower=-1, upper=1)
         self.assertAlmostEqual(fun(np.zeros(2)), -0.2)
+
+    def test_evaluate_batch(self):
+        """Test that vectorized batch evaluation matches row by row evaluation."""
+        batch = np.random.default_rng(1).uniform(-5, 5, (10, self.dimension))
+        for name in ('sphere', 'rastrigin', 'ackley', 'griewank', 'happy_cat'):
+            fun = get_problem(name, dimension=self.dimension)
+            expected = [fun(row) for row in batch]
+            np.testing.assert_allclose(fun.evaluate_batch(batch), expected, err_msg=name)
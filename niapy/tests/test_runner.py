@@ -3,7 +3,9 @@ from unittest import TestCase
 
 import numpy as np
 import niapy
+from niapy.algorithms.modified import SelfAdaptiveDifferentialEvolution
 from niapy.problems import Problem
+from niapy.task import Task
 
 
 class MyProblem(Problem):
@@ -22,6 +24,25 @@ class RunnerTestCase(TestCase):
     def test_runner(self):
         self.assertTrue(niapy.Runner(7, 100, 2, self.algorithms, self.problems).run())
 
+    def test_runner_parallel(self):
+        results = niapy.Runner(7, 100, 2, self.algorithms, self.problems, n_jobs=2).run()
+        self.assertTrue(results)
+        for alg_name in results:
+            for problem_name in results[alg_name]:
+                self.assertEqual(2, len(results[alg_name][problem_name]))
+
+    def test_runner_parallel_after_algorithm_run(self):
+        """Parallel runs must work after an algorithm already ran in this process.
+
+        Regression test: with a fork-based pool this ordering deadlocked once a
+        compiled jDE kernel had run in the parent.
+        """
+        task = Task(problem=MyProblem(7), max_evals=100)
+        SelfAdaptiveDifferentialEvolution(population_size=10, seed=1).run(task)
+        results = niapy.Runner(7, 100, 2, ['SelfAdaptiveDifferentialEvolution'], [MyProblem(7)], n_jobs=2).run()
+        self.assertTrue(results)
+        self.assertEqual(2, len(results['SelfAdaptiveDifferentialEvolution']['MyProblem']))
+
     def test_runner_bad_algorithm_throws(self):
         self.assertRaises(KeyError, lambda: niapy.Runner(4, 10, 3, ['EvolutionStrategy'], self.problems).run())
 
@@ -103,6 +103,29 @@ class TaskTestCase(TestCase):
         self.assertEqual(np.inf, self.task.eval(x))
         self.assertTrue(self.task.stopping_condition())
 
+    def test_eval_batch(self):
+        population = np.ones((5, self.D))
+        fitness = self.task.eval_batch(population)
+        self.assertTrue(np.array_equal(np.full(5, self.D), fitness))
+        self.assertEqual(5, self.task.evals)
+
+    def test_eval_batch_over_max_evals(self):
+        population = np.ones((self.nFES + 5, self.D))
+        fitness = self.task.eval_batch(population)
+        self.assertTrue(np.array_equal(np.full(self.nFES, self.D), fitness[:self.nFES]))
+        self.assertTrue(np.all(np.isinf(fitness[self.nFES:])))
+        self.assertEqual(self.nFES, self.task.evals)
+        self.assertTrue(self.task.stopping_condition())
+
+    def test_eval_batch_cutoff_value(self):
+        population = np.ones((5, self.D))
+        population[2] = np.zeros(self.D)
+        fitness = self.task.eval_batch(population)
+        self.assertEqual(0, fitness[2])
+        self.assertTrue(np.all(np.isinf(fitness[3:])))
+        self.assertEqual(3, self.task.evals)
+        self.assertTrue(self.task.stopping_condition())
+
     def test_evals_count(self):
         x = np.ones(self.D)
         for i in range(self.nFES):
@@ -23,7 +23,7 @@ def limit_inverse(x, lower, upper, **_kwargs):
     r"""Repair solution and put the solution in the random position inside of the bounds of problem.
 
     Args:
-        x (numpy.ndarray): Solution to check and repair if needed.
+        x (numpy.ndarray): Solution to check and repair if needed. May also be a whole population.
         lower (numpy.ndarray): Lower bounds of search space.
         upper (numpy.ndarray): Upper bounds of search space.
 
@@ -31,9 +31,11 @@ def limit_inverse(x, lower, upper, **_kwargs):
         numpy.ndarray: Solution in search space.
 
     """
-    ir = np.where(x < lower)
+    lower = np.broadcast_to(lower, x.shape)
+    upper = np.broadcast_to(upper, x.shape)
+    ir = x < lower
     x[ir] = upper[ir]
-    ir = np.where(x > upper)
+    ir = x > upper
     x[ir] = lower[ir]
     return x
 
@@ -42,7 +44,7 @@ def wang(x, lower, upper, **_kwargs):
     r"""Repair solution and put the solution in the random position inside of the bounds of problem.
 
     Args:
-        x (numpy.ndarray): Solution to check and repair if needed.
+        x (numpy.ndarray): Solution to check and repair if needed. May also be a whole population.
         lower (numpy.ndarray): Lower bounds of search space.
         upper (numpy.ndarray): Upper bounds of search space.
 
@@ -50,9 +52,11 @@ def wang(x, lower, upper, **_kwargs):
         numpy.ndarray: Solution in search space.
 
     """
-    ir = np.where(x < lower)
+    lower = np.broadcast_to(lower, x.shape)
+    upper = np.broadcast_to(upper, x.shape)
+    ir = x < lower
     x[ir] = np.amin([upper[ir], 2 * lower[ir] - x[ir]], axis=0)
-    ir = np.where(x > upper)
+    ir = x > upper
     x[ir] = np.amax([lower[ir], 2 * upper[ir] - x[ir]], axis=0)
     return x
 
@@ -61,7 +65,7 @@ def rand(x, lower, upper, rng=None, **_kwargs):
     r"""Repair solution and put the solution in the random position inside of the bounds of problem.
 
     Args:
-        x (numpy.ndarray): Solution to check and repair if needed.
+        x (numpy.ndarray): Solution to check and repair if needed. May also be a whole population.
         lower (numpy.ndarray): Lower bounds of search space.
         upper (numpy.ndarray): Upper bounds of search space.
         rng (numpy.random.Generator): Random generator.
@@ -71,9 +75,11 @@ def rand(x, lower, upper, rng=None, **_kwargs):
 
     """
     rng = default_rng(rng)
-    ir = np.where(x < lower)
+    lower = np.broadcast_to(lower, x.shape)
+    upper = np.broadcast_to(upper, x.shape)
+    ir = x < lower
     x[ir] = rng.uniform(lower[ir], upper[ir])
-    ir = np.where(x > upper)
+    ir = x > upper
     x[ir] = rng.uniform(lower[ir], upper[ir])
     return x
 
@@ -82,7 +88,7 @@ def reflect(x, lower, upper, **_kwargs):
     r"""Repair solution and put the solution in search space with reflection of how much the solution violates a bound.
 
     Args:
-        x (numpy.ndarray): Solution to be fixed.
+        x (numpy.ndarray): Solution to be fixed. May also be a whole population.
         lower (numpy.ndarray): Lower bounds of search space.
         upper (numpy.ndarray): Upper bounds of search space.
 
@@ -90,8 +96,10 @@ def reflect(x, lower, upper, **_kwargs):
         numpy.ndarray: Fix solution.
 
     """
-    ir = np.where(x > upper)
+    lower = np.broadcast_to(lower, x.shape)
+    upper = np.broadcast_to(upper, x.shape)
+    ir = x > upper
     x[ir] = lower[ir] + x[ir] % (upper[ir] - lower[ir])
-    ir = np.where(x < lower)
+    ir = x < lower
     x[ir] = lower[ir] + x[ir] % (upper[ir] - lower[ir])
     return x